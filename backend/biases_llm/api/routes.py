@@ -1,16 +1,14 @@
 """
 API routes for the LLM Bias Testing application
 """
+import time
 from typing import List
-from datetime import datetime
-from fastapi import APIRouter, HTTPException, status
+from fastapi import APIRouter, HTTPException, Response, status
 from biases_llm.models.schemas import (
     QueryRequest,
     ComparisonResponse,
     ModelsListResponse,
-    ModelConfig,
     BiasPromptsResponse,
-    BiasPrompt,
     HealthResponse
 )
 from biases_llm.config import config_manager
@@ -18,36 +16,30 @@ from biases_llm.services.llm_orchestrator import orchestrator
 
 router = APIRouter(prefix="/api")
 
+# Handlers below return bodies serialized from already validated models;
+# response_model=None keeps FastAPI from validating them again, the schema
+# is still documented through `responses`
+JSON_MEDIA_TYPE = "application/json"
+
 
 @router.get("/health", response_model=HealthResponse)
 async def health_check():
     """Health check endpoint"""
-    models_config = config_manager.load_models_config()
-    available_count = sum(1 for m in models_config.get("models", []) if m.get("available", False))
-
     return HealthResponse(
         status="healthy",
-        timestamp=datetime.utcnow().isoformat() + "Z",
-        available_models=available_count
+        timestamp=time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        available_models=config_manager.get_available_count()
     )
 
 
-@router.get("/models", response_model=ModelsListResponse)
-async def get_models():
+@router.get("/models", response_model=None, responses={200: {"model": ModelsListResponse}})
+async def get_models() -> Response:
     """Get list of available LLM models"""
-    models_config = config_manager.load_models_config()
-
-    # Convert to ModelConfig objects
-    models = [
-        ModelConfig(**model)
-        for model in models_config.get("models", [])
-    ]
-
-    return ModelsListResponse(models=models)
+    return Response(config_manager.get_models_response_json(), media_type=JSON_MEDIA_TYPE)
 
 
-@router.post("/query", response_model=ComparisonResponse)
-async def query_models(request: QueryRequest):
+@router.post("/query", response_model=None, responses={200: {"model": ComparisonResponse}})
+async def query_models(request: QueryRequest) -> Response:
     """
     Query multiple LLM models with the same prompt
 
@@ -65,14 +57,11 @@ async def query_models(request: QueryRequest):
         )
 
     # Validate that all requested models exist
-    models_config = config_manager.load_models_config()
-    available_model_ids = {m["id"] for m in models_config.get("models", [])}
-
-    invalid_models = [m for m in request.models if m not in available_model_ids]
+    invalid_models = set(request.models).difference(config_manager.get_model_ids())
     if invalid_models:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Invalid model IDs: {', '.join(invalid_models)}"
+            detail=f"Invalid model IDs: {', '.join(sorted(invalid_models))}"
         )
 
     # Query all models in parallel
@@ -82,23 +71,15 @@ async def query_models(request: QueryRequest):
             model_ids=request.models,
             temperature=request.temperature
         )
-        return result
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Error querying models: {str(e)}"
         )
+    return Response(result.model_dump_json(), media_type=JSON_MEDIA_TYPE)
 
 
-@router.get("/bias-prompts", response_model=BiasPromptsResponse)
-async def get_bias_prompts():
+@router.get("/bias-prompts", response_model=None, responses={200: {"model": BiasPromptsResponse}})
+async def get_bias_prompts() -> Response:
     """Get pre-built bias test prompts"""
-    prompts_data = config_manager.load_bias_prompts()
-
-    # Convert to BiasPrompt objects
-    prompts = [
-        BiasPrompt(**prompt)
-        for prompt in prompts_data
-    ]
-
-    return BiasPromptsResponse(prompts=prompts)
+    return Response(config_manager.get_bias_prompts_response_json(), media_type=JSON_MEDIA_TYPE)
@@ -2,17 +2,46 @@
 Configuration management for the LLM Bias Testing application
 """
 import os
-import json
+import logging
+import orjson
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Set, Tuple, Type
 from pydantic_settings import BaseSettings
-from pydantic import Field
+from pydantic import BaseModel, Field, ValidationError
 from dotenv import load_dotenv
+from biases_llm.models.schemas import (
+    ModelsListResponse,
+    ModelConfig,
+    BiasPromptsResponse,
+    BiasPrompt
+)
+
+logger = logging.getLogger(__name__)
 
 # Load environment variables from .env file
 load_dotenv()
 
 
+def _validate_entries(entries: List, schema: Type[BaseModel], kind: str) -> Tuple[List[Dict], List]:
+    """
+    Validate config entries one by one, skipping invalid ones
+
+    Returns:
+        Tuple of (valid raw entries, their validated models)
+    """
+    valid_entries = []
+    validated = []
+    for entry in entries:
+        try:
+            validated.append(schema.model_validate(entry))
+        except ValidationError as e:
+            entry_id = entry.get("id") if isinstance(entry, dict) else entry
+            logger.warning("Skipping invalid %s %r: %s", kind, entry_id, e)
+            continue
+        valid_entries.append(entry)
+    return valid_entries, validated
+
+
 class Settings(BaseSettings):
     """Application settings loaded from environment variables"""
 
@@ -26,6 +55,7 @@ class Settings(BaseSettings):
 
     # Application Settings
     backend_port: int = Field(8000, alias="BACKEND_PORT")
+    workers: int = Field(1, alias="WORKERS", ge=1)
     max_concurrent_queries: int = Field(5, alias="MAX_CONCURRENT_QUERIES")
     query_timeout_seconds: int = Field(60, alias="QUERY_TIMEOUT_SECONDS")
 
@@ -46,84 +76,157 @@ class ConfigManager:
 
     def __init__(self):
         self.settings = Settings()
+        # Settings are immutable for the process lifetime, resolve them once
+        self._env_cache: Dict = self.settings.model_dump()
         # Get project root directory (parent of backend folder)
         self.project_root = Path(__file__).parent.parent.parent
         self.config_dir = self.project_root / "config"
         self.frontend_dir = self.project_root / "frontend"
         self.models_config: Dict = {}
         self.bias_prompts: List = []
+        self.model_ids: Set[str] = set()
+        self._models_by_id: Dict[str, Dict] = {}
+        self.available_count: int = 0
+
+        # API response bodies serialized whenever the underlying config is (re)loaded
+        self.models_response_json: str = ModelsListResponse(models=[]).model_dump_json()
+        self.bias_prompts_response_json: str = BiasPromptsResponse(prompts=[]).model_dump_json()
+
+        # File modification times of the cached configs (None = not loaded yet)
+        self._models_mtime: Optional[float] = None
+        self._prompts_mtime: Optional[float] = None
 
     def load_models_config(self) -> Dict:
-        """Load model configurations from JSON file"""
+        """Load model configurations from JSON file (cached until the file changes)"""
         config_file = self.config_dir / "default_models.json"
 
-        if not config_file.exists():
-            print(f"Warning: Models config file not found at {config_file}")
+        try:
+            mtime = config_file.stat().st_mtime
+        except FileNotFoundError:
+            logger.warning("Models config file not found at %s", config_file)
             return {"models": []}
 
+        # Serve the cached config if the file has not been modified
+        if mtime == self._models_mtime:
+            return self.models_config
+
         try:
-            with open(config_file, 'r') as f:
-                self.models_config = json.load(f)
+            with open(config_file, 'rb') as f:
+                config = orjson.loads(f.read())
+            entries = config.get("models", [])
+        except Exception as e:
+            # Keep serving the last good config, a broken file is only parsed once
+            logger.error("Error loading models config: %s", e)
+            self._models_mtime = mtime
+            return self.models_config
 
-            # Update model availability based on API keys and endpoints
-            self._update_model_availability()
+        # One invalid entry must not take the other models down
+        models, configs = _validate_entries(entries, ModelConfig, "model config")
+        config["models"] = models
 
-            return self.models_config
-        except Exception as e:
-            print(f"Error loading models config: {e}")
-            return {"models": []}
+        # Update model availability based on API keys and endpoints
+        self._update_model_availability(models, configs)
+
+        # Swap in the new state together once it is complete
+        self.models_config = config
+        self._models_by_id = {m["id"]: m for m in models}
+        self.model_ids = set(self._models_by_id)
+        self.available_count = sum(1 for m in models if m["available"])
+        self.models_response_json = ModelsListResponse.model_construct(models=configs).model_dump_json()
+        self._models_mtime = mtime
+
+        return self.models_config
 
     def load_bias_prompts(self) -> List:
-        """Load pre-built bias test prompts from JSON file"""
+        """Load pre-built bias test prompts from JSON file (cached until the file changes)"""
         prompts_file = self.config_dir / "bias_test_prompts_v2.json"
 
-        if not prompts_file.exists():
-            print(f"Warning: Bias prompts file not found at {prompts_file}")
+        try:
+            mtime = prompts_file.stat().st_mtime
+        except FileNotFoundError:
+            logger.warning("Bias prompts file not found at %s", prompts_file)
             return []
 
-        try:
-            with open(prompts_file, 'r') as f:
-                data = json.load(f)
-                self.bias_prompts = data.get("prompts", [])
+        # Serve the cached prompts if the file has not been modified
+        if mtime == self._prompts_mtime:
             return self.bias_prompts
+
+        try:
+            with open(prompts_file, 'rb') as f:
+                entries = orjson.loads(f.read()).get("prompts", [])
         except Exception as e:
-            print(f"Error loading bias prompts: {e}")
-            return []
+            # Keep serving the last good prompts, a broken file is only parsed once
+            logger.error("Error loading bias prompts: %s", e)
+            self._prompts_mtime = mtime
+            return self.bias_prompts
 
-    def _update_model_availability(self):
-        """Update model availability based on API keys and endpoint availability"""
-        for model in self.models_config.get("models", []):
-            model_id = model.get("id")
-            requires_api_key = model.get("requires_api_key", False)
-            env_key = model.get("env_key")
-            api_type = model.get("api_type")
+        prompts, validated = _validate_entries(entries, BiasPrompt, "bias prompt")
+        self.bias_prompts = prompts
+        self.bias_prompts_response_json = BiasPromptsResponse.model_construct(prompts=validated).model_dump_json()
+        self._prompts_mtime = mtime
+        return self.bias_prompts
 
+    def _update_model_availability(self, models: List[Dict], configs: List[ModelConfig]):
+        """
+        Update model availability based on API keys and endpoint availability
+
+        Idempotent; only called when the models config file is (re)loaded.
+
+        Args:
+            models: Raw model entries, updated in place
+            configs: Validated models matching the raw entries, updated in place
+        """
+        for model, model_config in zip(models, configs):
             # Check if model is available
-            if requires_api_key and env_key:
+            if model_config.requires_api_key and model_config.env_key:
                 # Check if API key is set
-                api_key = getattr(self.settings, env_key.lower(), None)
-                model["available"] = api_key is not None and len(api_key) > 0
+                api_key = self._env_cache.get(model_config.env_key.lower())
+                available = api_key is not None and len(api_key) > 0
             else:
                 # For local models, assume available (actual connection check would require network call)
-                model["available"] = True
+                available = True
+            model["available"] = available
+            model_config.available = available
+
+    def get_models_response_json(self) -> str:
+        """Get the serialized models list response"""
+        self.load_models_config()
+        return self.models_response_json
+
+    def get_bias_prompts_response_json(self) -> str:
+        """Get the serialized bias prompts response"""
+        self.load_bias_prompts()
+        return self.bias_prompts_response_json
+
+    def get_available_count(self) -> int:
+        """Get the number of currently available models"""
+        self.load_models_config()
+        return self.available_count
+
+    def get_model_ids(self) -> Set[str]:
+        """Get the set of configured model IDs"""
+        self.load_models_config()
+        return self.model_ids
+
+    def get_models_version(self) -> Optional[float]:
+        """Get the modification time of the loaded models config (None if not loaded)"""
+        self.load_models_config()
+        return self._models_mtime
 
     def get_model_config(self, model_id: str) -> Optional[Dict]:
         """Get configuration for a specific model by ID"""
         if not self.models_config:
             self.load_models_config()
 
-        for model in self.models_config.get("models", []):
-            if model.get("id") == model_id:
-                return model
-        return None
+        return self._models_by_id.get(model_id)
 
     def get_api_key(self, env_key: str) -> Optional[str]:
         """Get API key from environment"""
-        return getattr(self.settings, env_key.lower(), None)
+        return self._env_cache.get(env_key.lower())
 
     def get_endpoint(self, endpoint_env: str) -> Optional[str]:
         """Get endpoint URL from environment"""
-        return getattr(self.settings, endpoint_env.lower(), None)
+        return self._env_cache.get(endpoint_env.lower())
 
     def validate_config(self) -> Dict[str, List[str]]:
         """Validate configuration and return warnings/errors"""
@@ -150,6 +253,28 @@ class ConfigManager:
             "errors": errors
         }
 
+    def bootstrap(self) -> Tuple[List[str], List[str], List[Dict], List[Dict], List]:
+        """
+        Validate and load all configuration at startup
+
+        Returns:
+            Tuple of (warnings, errors, available models, unavailable models, bias prompts)
+        """
+        validation = self.validate_config()
+
+        available = []
+        unavailable = []
+        for model in self.load_models_config().get("models", []):
+            (available if model.get("available", False) else unavailable).append(model)
+
+        return (
+            validation["warnings"],
+            validation["errors"],
+            available,
+            unavailable,
+            self.load_bias_prompts()
+        )
+
 
 # Global config manager instance
 config_manager = ConfigManager()
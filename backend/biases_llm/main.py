@@ -1,17 +1,25 @@
 """
 FastAPI main application for LLM Bias Testing
 """
+import logging
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.staticfiles import StaticFiles
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
 from biases_llm.config import config_manager
 from biases_llm.api.routes import router
+from biases_llm.services.llm_orchestrator import orchestrator
+from biases_llm.utils.static_files import CachedStaticFiles
+
+logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+logger = logging.getLogger("biases_llm")
 
 # Create FastAPI app
 app = FastAPI(
     title="LLM Bias Testing API",
     description="API for testing and comparing biases across different language models",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse
 )
 
 # Configure CORS
@@ -23,73 +31,82 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress large responses (e.g. multi-model comparisons)
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+
 # Include API routes
 app.include_router(router)
 
 # Mount static files for frontend
 if config_manager.frontend_dir.exists():
-    app.mount("/", StaticFiles(directory=str(config_manager.frontend_dir), html=True), name="frontend")
+    app.mount("/", CachedStaticFiles(directory=str(config_manager.frontend_dir), html=True), name="frontend")
 
 
 @app.on_event("startup")
 async def startup_event():
     """Application startup event"""
-    print("=" * 60)
-    print("LLM Bias Testing Application Starting...")
-    print("=" * 60)
-
-    # Load and validate configuration
-    validation = config_manager.validate_config()
-
-    # Print warnings
-    if validation["warnings"]:
-        print("\nWarnings:")
-        for warning in validation["warnings"]:
-            print(f"  ⚠️  {warning}")
-
-    # Print errors (if any)
-    if validation["errors"]:
-        print("\nErrors:")
-        for error in validation["errors"]:
-            print(f"  ❌ {error}")
-
-    # Load models configuration
-    models_config = config_manager.load_models_config()
-    available_models = [m for m in models_config.get("models", []) if m.get("available", False)]
-    unavailable_models = [m for m in models_config.get("models", []) if not m.get("available", False)]
-
-    print(f"\n📊 Models Configuration:")
-    print(f"  ✅ Available models: {len(available_models)}")
+    logger.info("=" * 60)
+    logger.info("LLM Bias Testing Application Starting...")
+    logger.info("=" * 60)
+
+    # Validate and load configuration in a single pass
+    warnings, errors, available_models, unavailable_models, bias_prompts = config_manager.bootstrap()
+
+    # Open the shared HTTP connection pool used by all model adapters
+    await orchestrator.__aenter__()
+
+    # Log warnings
+    for warning in warnings:
+        logger.warning("⚠️  %s", warning)
+
+    # Log errors (if any)
+    for error in errors:
+        logger.error("❌ %s", error)
+
+    logger.info("📊 Models Configuration:")
+    logger.info("  ✅ Available models: %d", len(available_models))
     for model in available_models:
-        print(f"     - {model['name']} ({model['id']})")
+        logger.info("     - %s (%s)", model["name"], model["id"])
 
     if unavailable_models:
-        print(f"  ❌ Unavailable models: {len(unavailable_models)}")
+        logger.info("  ❌ Unavailable models: %d", len(unavailable_models))
         for model in unavailable_models:
             reason = "Missing API key" if model.get("requires_api_key") else "Endpoint not configured"
-            print(f"     - {model['name']} ({model['id']}) - {reason}")
+            logger.info("     - %s (%s) - %s", model["name"], model["id"], reason)
 
-    # Load bias prompts
-    bias_prompts = config_manager.load_bias_prompts()
-    print(f"\n📝 Bias Test Prompts: {len(bias_prompts)} loaded")
+    logger.info("📝 Bias Test Prompts: %d loaded", len(bias_prompts))
 
-    print("\n" + "=" * 60)
-    print("🚀 Application ready!")
-    print(f"📖 API Documentation: http://localhost:{config_manager.settings.backend_port}/docs")
-    print(f"🌐 Frontend: http://localhost:{config_manager.settings.backend_port}/")
-    print("=" * 60 + "\n")
+    logger.info("=" * 60)
+    logger.info("🚀 Application ready!")
+    logger.info("📖 API Documentation: http://localhost:%d/docs", config_manager.settings.backend_port)
+    logger.info("🌐 Frontend: http://localhost:%d/", config_manager.settings.backend_port)
+    logger.info("=" * 60)
 
 
 @app.on_event("shutdown")
 async def shutdown_event():
     """Application shutdown event"""
-    print("\n👋 Shutting down LLM Bias Testing Application...")
+    logger.info("👋 Shutting down LLM Bias Testing Application...")
+    await orchestrator.aclose()
 
 
 if __name__ == "__main__":
     import uvicorn
+
+    # uvloop speeds up task scheduling for the model fan-out; it is not
+    # available on every platform (e.g. Windows), so fall back to asyncio
+    try:
+        import uvloop  # noqa: F401
+        loop = "uvloop"
+    except ImportError:
+        loop = "asyncio"
+
+    # Import string form is required to run multiple workers
     uvicorn.run(
-        app,
+        "biases_llm.main:app",
         host="0.0.0.0",
-        port=config_manager.settings.backend_port
+        port=config_manager.settings.backend_port,
+        workers=config_manager.settings.workers,
+        loop=loop,
+        http="httptools"
     )
@@ -1,7 +1,7 @@
 """
 Pydantic models for request/response schemas
 """
-from typing import List, Optional
+from typing import List, Literal, Optional
 from pydantic import BaseModel, Field
 from datetime import datetime
 
@@ -39,6 +39,8 @@ class ModelConfig(BaseModel):
     env_key: Optional[str] = Field(None, description="Environment variable name for API key")
     endpoint_env: Optional[str] = Field(None, description="Environment variable name for custom endpoint")
     model_name: Optional[str] = Field(None, description="Specific model name for the provider")
+    dtype: Optional[Literal["bfloat16", "float16", "float32", "int8"]] = Field(None, description="Weight precision for local transformers models")
+    max_concurrency: Optional[int] = Field(None, description="Maximum number of concurrent queries to this model", ge=1)
     available: bool = Field(default=False, description="Whether the model is currently available")
 
 
@@ -2,17 +2,56 @@
 Anthropic adapter for Claude models
 """
 import time
+from functools import lru_cache
 from typing import Optional
+import httpx
+import anthropic
 from anthropic import AsyncAnthropic
-from biases_llm.services.llm_adapter import LLMAdapter
+from biases_llm.services.llm_adapter import (
+    LLMAdapter,
+    create_http_client,
+    friendly_error_message,
+    AUTH_ERROR,
+    CONNECTION_ERROR,
+    TIMEOUT_ERROR,
+    RATE_LIMIT_ERROR
+)
 from biases_llm.models.schemas import ModelResponse
 from biases_llm.config import config_manager
 
 
+@lru_cache(maxsize=32)
+def _anthropic_client(
+    api_key: Optional[str],
+    http_client: httpx.AsyncClient
+) -> AsyncAnthropic:
+    """Get a client shared by all adapters using the same API key and HTTP client"""
+    return AsyncAnthropic(
+        api_key=api_key,
+        http_client=http_client
+    )
+
+
+# Anthropic only caches prefixes of at least 1024 tokens (2048 for Haiku) and
+# bills cache writes above normal input, so shorter prompts are sent unmarked.
+# Roughly 4 characters per token.
+_MIN_CACHEABLE_PROMPT_CHARS = 4096
+
+# Provider exceptions mapped to friendly messages (timeout before its connection base class)
+_ERROR_TYPES = (
+    (anthropic.AuthenticationError, AUTH_ERROR),
+    (anthropic.RateLimitError, RATE_LIMIT_ERROR),
+    (anthropic.APITimeoutError, TIMEOUT_ERROR),
+    (anthropic.APIConnectionError, CONNECTION_ERROR),
+)
+
+
 class AnthropicAdapter(LLMAdapter):
     """Adapter for Anthropic Claude models"""
 
-    def __init__(self, model_config: dict):
+    __slots__ = ("client", "_owns_client", "model_name_param")
+
+    def __init__(self, model_config: dict, http_client: Optional[httpx.AsyncClient] = None):
         super().__init__(model_config)
 
         # Get API key
@@ -20,8 +59,12 @@ class AnthropicAdapter(LLMAdapter):
         if model_config.get("env_key"):
             api_key = config_manager.get_api_key(model_config["env_key"])
 
-        # Initialize Anthropic client
-        self.client = AsyncAnthropic(api_key=api_key)
+        # Reuse the pooled client for this API key, or own one when used standalone
+        self._owns_client = http_client is None
+        if self._owns_client:
+            self.client = AsyncAnthropic(api_key=api_key, http_client=create_http_client())
+        else:
+            self.client = _anthropic_client(api_key, http_client)
 
         # Get the specific model name
         self.model_name_param = model_config.get("model_name") or model_config.get("id")
@@ -34,18 +77,39 @@ class AnthropicAdapter(LLMAdapter):
         api_key = config_manager.get_api_key(env_key)
         return api_key is not None and len(api_key) > 0
 
-    async def query(self, prompt: str, temperature: float = 0.7) -> ModelResponse:
+    async def aclose(self):
+        """Close the SDK client if the adapter created its own HTTP client"""
+        if self._owns_client:
+            await self.client.close()
+
+    @classmethod
+    def clear_client_cache(cls):
+        """Forget SDK clients shared through an HTTP client that is being closed"""
+        _anthropic_client.cache_clear()
+
+    async def query(
+        self,
+        prompt: str,
+        temperature: float = 0.7,
+        cache_key: Optional[str] = None
+    ) -> ModelResponse:
         """
         Query the Anthropic API
 
         Args:
             prompt: The prompt to send to the LLM
             temperature: Temperature parameter for generation
+            cache_key: When set, a long enough prompt is marked as a cacheable prefix
 
         Returns:
             ModelResponse with result or error
         """
-        start_time = time.time()
+        start_time = time.perf_counter_ns()
+
+        # Anthropic caches marked prefixes by content, no explicit key is sent
+        content = prompt
+        if cache_key and len(prompt) >= _MIN_CACHEABLE_PROMPT_CHARS:
+            content = [{"type": "text", "text": prompt, "cache_control": {"type": "ephemeral"}}]
 
         try:
             # Make API call
@@ -54,12 +118,12 @@ class AnthropicAdapter(LLMAdapter):
                 max_tokens=500,  # Reasonable limit for bias testing
                 temperature=temperature,
                 messages=[
-                    {"role": "user", "content": prompt}
+                    {"role": "user", "content": content}
                 ]
             )
 
             # Calculate latency
-            latency_ms = int((time.time() - start_time) * 1000)
+            latency_ms = (time.perf_counter_ns() - start_time) // 1_000_000
 
             # Extract response text
             response_text = response.content[0].text
@@ -74,18 +138,10 @@ class AnthropicAdapter(LLMAdapter):
 
         except Exception as e:
             # Calculate latency even for errors
-            latency_ms = int((time.time() - start_time) * 1000)
-
-            # Determine error message
-            error_msg = str(e)
+            latency_ms = (time.perf_counter_ns() - start_time) // 1_000_000
 
             # Provide user-friendly error messages
-            if "authentication" in error_msg.lower() or "api key" in error_msg.lower():
-                error_msg = "Authentication failed: Invalid or missing API key"
-            elif "rate limit" in error_msg.lower():
-                error_msg = "Rate limit exceeded: Please wait before making more requests"
-            elif "timeout" in error_msg.lower():
-                error_msg = "Request timeout: Model took too long to respond"
+            error_msg = friendly_error_message(e, _ERROR_TYPES)
 
             return ModelResponse(
                 model_id=self.model_id,
@@ -1,13 +1,66 @@
 """
 Base adapter interface for LLM providers
 """
-from abc import ABC, abstractmethod
-from typing import Dict, Optional
+from typing import Dict, Optional, Sequence, Tuple, Type
+import httpx
 from biases_llm.models.schemas import ModelResponse
 
+# User-friendly error messages shared by all adapters
+AUTH_ERROR = "Authentication failed: Invalid or missing API key"
+CONNECTION_ERROR = "Connection refused: Model not running or endpoint unreachable"
+TIMEOUT_ERROR = "Request timeout: Model took too long to respond"
+RATE_LIMIT_ERROR = "Rate limit exceeded: Please wait before making more requests"
 
-class LLMAdapter(ABC):
-    """Abstract base class for LLM adapters"""
+# Fallback keyword matching on the lowercased error text, checked in order
+_ERROR_KEYWORDS = (
+    ("authentication", AUTH_ERROR),
+    ("api key", AUTH_ERROR),
+    ("connection", CONNECTION_ERROR),
+    ("refused", CONNECTION_ERROR),
+    ("timeout", TIMEOUT_ERROR),
+    ("rate limit", RATE_LIMIT_ERROR),
+)
+
+
+def create_http_client() -> httpx.AsyncClient:
+    """Create a pooled HTTP/2 client for provider API calls"""
+    return httpx.AsyncClient(
+        http2=True,
+        limits=httpx.Limits(max_connections=100, max_keepalive_connections=50)
+    )
+
+
+def friendly_error_message(
+    error: Exception,
+    error_types: Sequence[Tuple[Type[BaseException], str]] = ()
+) -> str:
+    """
+    Map an exception to a user-friendly error message
+
+    Args:
+        error: The exception raised while querying a model
+        error_types: Provider-specific (exception type, message) pairs checked
+            before falling back to keyword matching on the error text
+
+    Returns:
+        A friendly message for known failures, otherwise the original error text
+    """
+    for error_type, message in error_types:
+        if isinstance(error, error_type):
+            return message
+
+    error_msg = str(error)
+    lowered = error_msg.lower()
+    for keyword, message in _ERROR_KEYWORDS:
+        if keyword in lowered:
+            return message
+    return error_msg
+
+
+class LLMAdapter:
+    """Base class for LLM adapters"""
+
+    __slots__ = ("model_config", "model_id", "model_name", "_model_info")
 
     def __init__(self, model_config: Dict):
         """
@@ -19,22 +72,32 @@ class LLMAdapter(ABC):
         self.model_config = model_config
         self.model_id = model_config.get("id")
         self.model_name = model_config.get("name")
+        self._model_info = {
+            "id": self.model_id,
+            "name": self.model_name,
+            "provider": model_config.get("provider"),
+            "api_type": model_config.get("api_type"),
+        }
 
-    @abstractmethod
-    async def query(self, prompt: str, temperature: float = 0.7) -> ModelResponse:
+    async def query(
+        self,
+        prompt: str,
+        temperature: float = 0.7,
+        cache_key: Optional[str] = None
+    ) -> ModelResponse:
         """
         Query the LLM with a prompt
 
         Args:
             prompt: The prompt to send to the LLM
             temperature: Temperature parameter for generation (0.0 to 2.0)
+            cache_key: Stable hash of the prompt, used for provider-side prompt caching
 
         Returns:
             ModelResponse containing the result or error
         """
-        pass
+        raise NotImplementedError
 
-    @abstractmethod
     def validate_config(self) -> bool:
         """
         Validate that the adapter configuration is correct
@@ -42,7 +105,14 @@ class LLMAdapter(ABC):
         Returns:
             True if configuration is valid, False otherwise
         """
-        pass
+        raise NotImplementedError
+
+    async def aclose(self):
+        """Release resources held by the adapter (shared HTTP clients are owned by the orchestrator)"""
+
+    @classmethod
+    def clear_client_cache(cls):
+        """Forget SDK clients shared through an HTTP client that is being closed"""
 
     def get_model_info(self) -> Dict:
         """
@@ -51,9 +121,4 @@ class LLMAdapter(ABC):
         Returns:
             Dictionary with model metadata
         """
-        return {
-            "id": self.model_id,
-            "name": self.model_name,
-            "provider": self.model_config.get("provider"),
-            "api_type": self.model_config.get("api_type"),
-        }
+        return self._model_info
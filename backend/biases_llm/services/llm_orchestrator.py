@@ -2,25 +2,252 @@
 LLM Orchestrator for coordinating parallel queries to multiple models
 """
 import asyncio
-from typing import List
-from datetime import datetime
+import logging
+import time
+from collections import OrderedDict
+from functools import partial
+from hashlib import blake2b
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
+import httpx
+from datetime import datetime, timezone
 from biases_llm.models.schemas import ModelResponse, ComparisonResponse
-from biases_llm.services.llm_adapter import LLMAdapter
+from biases_llm.services.llm_adapter import LLMAdapter, create_http_client
 from biases_llm.services.openai_adapter import OpenAIAdapter
 from biases_llm.services.anthropic_adapter import AnthropicAdapter
 from biases_llm.services.transformers_adapter import TransformersAdapter
 from biases_llm.config import config_manager
 
+logger = logging.getLogger(__name__)
+
+
+# Adapter classes by model API type
+_ADAPTER_FACTORIES = {
+    "openai": OpenAIAdapter,
+    "anthropic": AnthropicAdapter,
+    "transformers": TransformersAdapter,
+}
+
+# Responses of deterministic (temperature 0) queries are reused for a while
+_RESPONSE_CACHE_SIZE = 1024
+_RESPONSE_CACHE_TTL_SECONDS = 300.0
+
+# Models whose adapter failed to build are retried at most this often
+_ADAPTER_RETRY_SECONDS = 30.0
+
 
 class LLMOrchestrator:
     """Coordinates parallel queries to multiple LLM models"""
 
+    __slots__ = (
+        "adapters_cache",
+        "_adapter_errors",
+        "_model_names",
+        "_query_fns",
+        "_semaphores",
+        "_response_cache",
+        "_inflight",
+        "_session",
+        "_ts_cache",
+        "_timeout",
+        "_config_version",
+        "_retry_at",
+        "_reload_task"
+    )
+
     def __init__(self):
+        # Adapters are built by reload() once an event loop is running
+        self.adapters_cache: Dict[str, LLMAdapter] = {}
+        self._adapter_errors: Dict[str, str] = {}
+        self._model_names: Dict[str, str] = {}
+        self._query_fns: Dict[str, Callable[..., Awaitable[ModelResponse]]] = {}
+        self._semaphores: Dict[str, asyncio.Semaphore] = {}
+        self._response_cache: "OrderedDict[Tuple[str, str, float], Tuple[float, ModelResponse]]" = OrderedDict()
+        self._inflight: Dict[Tuple[str, str, float], asyncio.Task] = {}
+        self._ts_cache: Tuple[int, str] = (0, "")
+        self._timeout: int = config_manager.settings.query_timeout_seconds
+        self._session: Optional[httpx.AsyncClient] = None
+        # Models config the adapters were built from, and when failed models are retried
+        self._config_version: Optional[float] = None
+        self._retry_at: float = 0.0
+        self._reload_task: Optional[asyncio.Task] = None
+
+    async def __aenter__(self) -> "LLMOrchestrator":
+        """Open the HTTP client shared by all API adapters and build the adapters"""
+        self._session = create_http_client()
+        await self.reload()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        """Close the adapters and the shared HTTP client"""
+        await self.aclose()
+
+    async def aclose(self):
+        """Close every adapter and the shared HTTP client"""
+        if self._reload_task is not None:
+            self._reload_task.cancel()
+            self._reload_task = None
+        for task in self._inflight.values():
+            task.cancel()
+        self._inflight.clear()
+        for adapter in self.adapters_cache.values():
+            await adapter.aclose()
+
+        # Drop the adapters so a later __aenter__ rebuilds them on a new HTTP client
         self.adapters_cache = {}
+        self._query_fns = {}
+        self._adapter_errors = {}
+        self._config_version = None
+        self._response_cache.clear()
+
+        if self._session is not None:
+            # SDK clients cached per HTTP client would keep using the closed one
+            for factory in _ADAPTER_FACTORIES.values():
+                factory.clear_client_cache()
+            await self._session.aclose()
+            self._session = None
+
+    def _create_adapter(self, model_config: Dict) -> LLMAdapter:
+        """
+        Create the adapter for a model configuration
+
+        Args:
+            model_config: Dictionary containing model configuration
+
+        Returns:
+            LLMAdapter instance for the model
+        """
+        api_type = model_config.get("api_type")
+        factory = _ADAPTER_FACTORIES.get(api_type)
+        if factory is None:
+            raise ValueError(f"Unsupported API type: {api_type}")
+
+        return factory(model_config, http_client=self._session)
+
+    def _create_adapters(
+        self,
+        model_configs: List[Dict],
+        current: Dict[str, LLMAdapter]
+    ) -> Tuple[Dict[str, LLMAdapter], Dict[str, str]]:
+        """
+        Create the adapters for every configured model (blocking, may load model weights)
+
+        Args:
+            model_configs: Model configurations, read on the event loop
+            current: Adapters built so far, kept for models whose configuration is unchanged
+
+        Returns:
+            Tuple of (adapters by model ID, creation errors by model ID)
+        """
+        adapters = {}
+        errors = {}
+        for model_config in model_configs:
+            model_id = model_config.get("id")
+            adapter = current.get(model_id)
+            if adapter is not None and adapter.model_config == model_config:
+                adapters[model_id] = adapter
+                continue
+            try:
+                adapters[model_id] = self._create_adapter(model_config)
+            except Exception as e:
+                # Keep the reason so queries to this model report it
+                errors[model_id] = str(e)
+        return adapters, errors
+
+    async def reload(self):
+        """
+        Bring the adapters in line with the models config off the event loop
+
+        Adapters of unchanged models are kept; new, changed and previously
+        failed models are (re)built and validated.
+        """
+        loop = asyncio.get_running_loop()
+        current = self.adapters_cache
+        # ConfigManager is only touched on the event loop, never from the worker thread
+        model_configs = config_manager.load_models_config().get("models", [])
+        version = config_manager.get_models_version()
+        adapters, errors = await asyncio.to_thread(self._create_adapters, model_configs, current)
+        kept = {model_id for model_id, adapter in adapters.items() if current.get(model_id) is adapter}
+
+        # Validate the new adapters concurrently in the default executor
+        built = [model_id for model_id in adapters if model_id not in kept]
+        results = await asyncio.gather(
+            *(loop.run_in_executor(None, adapters[model_id].validate_config) for model_id in built),
+            return_exceptions=True
+        )
+        for model_id, valid in zip(built, results):
+            if valid is not True:
+                del adapters[model_id]
+                errors[model_id] = (
+                    str(valid) if isinstance(valid, Exception)
+                    else f"Invalid configuration for model {model_id}"
+                )
+
+        model_names = {}
+        semaphores = {}
+        default_concurrency = config_manager.settings.max_concurrent_queries
+        for model_config in model_configs:
+            model_id = model_config.get("id")
+            model_names[model_id] = model_config.get("name", model_id)
+            if model_id in kept and model_id in self._semaphores:
+                # Keep counting the queries already running on this model
+                semaphores[model_id] = self._semaphores[model_id]
+            else:
+                # Cap in-flight queries per model to apply backpressure
+                semaphores[model_id] = asyncio.Semaphore(
+                    model_config.get("max_concurrency") or default_concurrency
+                )
+
+        self.adapters_cache = adapters
+        self._query_fns = {model_id: adapter.query for model_id, adapter in adapters.items()}
+        self._adapter_errors = errors
+        self._model_names = model_names
+        self._semaphores = semaphores
+        self._config_version = version
+        self._retry_at = time.monotonic() + _ADAPTER_RETRY_SECONDS
+
+        # Cached answers of rebuilt or removed models may be stale
+        for key in [key for key in self._response_cache if key[0] not in kept]:
+            del self._response_cache[key]
+
+    def _needs_reload(self) -> bool:
+        """Whether the models config changed or failed models are due for a retry"""
+        if config_manager.get_models_version() != self._config_version:
+            return True
+        return bool(self._adapter_errors) and time.monotonic() >= self._retry_at
+
+    def _schedule_reload(self):
+        """
+        Reload the adapters in the background if they are out of date
+
+        Queries keep using the current adapters until the new ones are swapped in.
+        """
+        if self._reload_task is not None or not self._needs_reload():
+            return
+
+        # Move the retry deadline first so no other request triggers the same retry
+        self._retry_at = time.monotonic() + _ADAPTER_RETRY_SECONDS
+        self._reload_task = asyncio.create_task(self.reload(), name="reload-adapters")
+        self._reload_task.add_done_callback(self._reload_done)
+
+    def _reload_done(self, task: asyncio.Task):
+        """Forget the finished background reload and log its failure"""
+        if self._reload_task is task:
+            self._reload_task = None
+        if task.cancelled():
+            return
+        if task.exception() is not None:
+            logger.error("Error reloading model adapters: %s", task.exception())
+            return
+        # The config may have changed again while this reload was running
+        self._schedule_reload()
+
+    def refresh_settings(self):
+        """Re-read query settings from the configuration"""
+        self._timeout = config_manager.settings.query_timeout_seconds
 
     def _get_adapter(self, model_id: str) -> LLMAdapter:
         """
-        Get or create an adapter for a specific model
+        Get the prebuilt adapter for a specific model
 
         Args:
             model_id: The model identifier
@@ -28,92 +255,163 @@ class LLMOrchestrator:
         Returns:
             LLMAdapter instance for the model
         """
-        # Check cache first
-        if model_id in self.adapters_cache:
+        try:
             return self.adapters_cache[model_id]
+        except KeyError:
+            if model_id not in self._adapter_errors and self._reload_task is not None:
+                # Added to the config, its adapter is being built in the background
+                raise ValueError(f"Model {model_id} is still loading, try again shortly") from None
+            error = self._adapter_errors.get(model_id, f"Model {model_id} not found in configuration")
+            raise ValueError(error) from None
 
-        # Get model configuration
-        model_config = config_manager.get_model_config(model_id)
-        if not model_config:
-            raise ValueError(f"Model {model_id} not found in configuration")
+    def _timestamp(self) -> str:
+        """Current UTC time in ISO 8601, the seconds part is formatted once per second"""
+        now = time.time()
+        second = int(now)
+        if second != self._ts_cache[0]:
+            formatted = datetime.fromtimestamp(second, timezone.utc).strftime("%Y-%m-%dT%H:%M:%S")
+            self._ts_cache = (second, formatted)
+        return f"{self._ts_cache[1]}.{int((now - second) * 1000):03d}Z"
 
-        # Create appropriate adapter based on API type
-        api_type = model_config.get("api_type")
+    def _timeout_response(self, model_id: str, timeout: int) -> ModelResponse:
+        """Build the response for a model that did not answer in time"""
+        return ModelResponse.model_construct(
+            model_id=model_id,
+            model_name=self._model_names.get(model_id, model_id),
+            response=None,
+            latency_ms=timeout * 1000,
+            error=f"Request timeout: Model took longer than {timeout} seconds"
+        )
 
-        if api_type == "openai":
-            adapter = OpenAIAdapter(model_config)
-        elif api_type == "anthropic":
-            adapter = AnthropicAdapter(model_config)
-        elif api_type == "transformers":
-            adapter = TransformersAdapter(model_config)
-        else:
-            raise ValueError(f"Unsupported API type: {api_type}")
+    def _error_response(self, model_id: str, error: BaseException) -> ModelResponse:
+        """Build the response for a model whose query raised an exception"""
+        return ModelResponse.model_construct(
+            model_id=model_id,
+            model_name=self._model_names.get(model_id, model_id),
+            response=None,
+            latency_ms=0,
+            error=str(error)
+        )
+
+    def _cached_response(self, key: Tuple[str, str, float]) -> Optional[ModelResponse]:
+        """Get a cached response if it has not expired (shared, copy before handing it out)"""
+        entry = self._response_cache.get(key)
+        if entry is None:
+            return None
 
-        # Validate configuration
-        if not adapter.validate_config():
-            raise ValueError(f"Invalid configuration for model {model_id}")
+        stored_at, response = entry
+        if time.monotonic() - stored_at > _RESPONSE_CACHE_TTL_SECONDS:
+            del self._response_cache[key]
+            return None
 
-        # Cache the adapter
-        self.adapters_cache[model_id] = adapter
+        self._response_cache.move_to_end(key)
+        return response
 
-        return adapter
+    def _cache_response(self, key: Tuple[str, str, float], response: ModelResponse):
+        """Store a response, evicting the least recently used one when full"""
+        self._response_cache[key] = (time.monotonic(), response)
+        self._response_cache.move_to_end(key)
+        if len(self._response_cache) > _RESPONSE_CACHE_SIZE:
+            self._response_cache.popitem(last=False)
+
+    async def _query_adapter(
+        self,
+        model_id: str,
+        prompt: str,
+        temperature: float,
+        cache_key: str
+    ) -> ModelResponse:
+        """Query the model's adapter, turning errors into error responses"""
+        try:
+            # Prebound adapter.query, unknown models raise with their reason
+            query = self._query_fns.get(model_id) or self._get_adapter(model_id).query
+            async with self._semaphores[model_id]:
+                return await query(prompt, temperature, cache_key=cache_key)
+        except asyncio.CancelledError:
+            if asyncio.current_task().cancelling():
+                raise
+            # The adapter dropped the query (e.g. it was closed), not this request
+            return self._error_response(model_id, RuntimeError("Query was cancelled"))
+        except Exception as e:
+            # Errors become responses so every slot gets filled
+            return self._error_response(model_id, e)
 
     async def _query_single_model(
         self,
         model_id: str,
         prompt: str,
         temperature: float,
-        timeout: int = 30
+        cache_key: str
     ) -> ModelResponse:
         """
-        Query a single model with timeout protection
+        Query a single model
 
         Args:
             model_id: The model identifier
             prompt: The prompt to send
             temperature: Temperature parameter
-            timeout: Timeout in seconds
+            cache_key: Hash of the prompt, computed once per query_models call
 
         Returns:
             ModelResponse with result or error
         """
-        try:
-            # Get adapter
-            adapter = self._get_adapter(model_id)
+        # Only greedy decoding is deterministic, sampled answers must stay fresh
+        if temperature != 0:
+            return await self._query_adapter(model_id, prompt, temperature, cache_key)
+
+        # Reused answers report how long this caller waited, not the original round trip
+        start_time = time.perf_counter_ns()
+        response_key = (model_id, cache_key, temperature)
+        cached = self._cached_response(response_key)
+        if cached is not None:
+            return cached.model_copy(update={"latency_ms": (time.perf_counter_ns() - start_time) // 1_000_000})
 
-            # Query with timeout
-            response = await asyncio.wait_for(
-                adapter.query(prompt, temperature),
-                timeout=timeout
+        # Share an identical query that is already running. The shared task is
+        # owned by the in-flight map, so a caller leaving early does not cancel it
+        shared = self._inflight.get(response_key)
+        if shared is None:
+            shared = asyncio.create_task(
+                self._query_shared(response_key, model_id, prompt, temperature, cache_key),
+                name=f"shared-query:{model_id}"
             )
+            self._inflight[response_key] = shared
+            shared.add_done_callback(partial(self._release_inflight, response_key))
 
-            return response
+        try:
+            response = await asyncio.shield(shared)
+        except asyncio.CancelledError:
+            if asyncio.current_task().cancelling():
+                # This request was cancelled (e.g. its own deadline expired)
+                raise
+            # The shared query was cancelled under us, run our own instead
+            return await self._query_adapter(model_id, prompt, temperature, cache_key)
+        return response.model_copy(update={"latency_ms": (time.perf_counter_ns() - start_time) // 1_000_000})
 
-        except asyncio.TimeoutError:
-            # Get model info for error response
-            model_config = config_manager.get_model_config(model_id)
-            model_name = model_config.get("name", model_id) if model_config else model_id
+    async def _query_shared(
+        self,
+        response_key: Tuple[str, str, float],
+        model_id: str,
+        prompt: str,
+        temperature: float,
+        cache_key: str
+    ) -> ModelResponse:
+        """Run a deterministic query on behalf of every caller waiting on it"""
+        timeout = self._timeout
+        try:
+            # No caller waits longer than this, do not keep the model busy past it
+            async with asyncio.timeout(timeout):
+                response = await self._query_adapter(model_id, prompt, temperature, cache_key)
+        except TimeoutError:
+            return self._timeout_response(model_id, timeout)
 
-            return ModelResponse(
-                model_id=model_id,
-                model_name=model_name,
-                response=None,
-                latency_ms=timeout * 1000,
-                error=f"Request timeout: Model took longer than {timeout} seconds"
-            )
+        if response.error is None:
+            self._cache_response(response_key, response)
+        return response
 
-        except Exception as e:
-            # Get model info for error response
-            model_config = config_manager.get_model_config(model_id)
-            model_name = model_config.get("name", model_id) if model_config else model_id
-
-            return ModelResponse(
-                model_id=model_id,
-                model_name=model_name,
-                response=None,
-                latency_ms=0,
-                error=str(e)
-            )
+    def _release_inflight(self, response_key: Tuple[str, str, float], task: asyncio.Task):
+        """Forget a finished shared query unless a newer one took its place"""
+        if self._inflight.get(response_key) is task:
+            del self._inflight[response_key]
 
     async def query_models(
         self,
@@ -132,29 +430,84 @@ class LLMOrchestrator:
         Returns:
             ComparisonResponse with all model responses
         """
-        # Get timeout from config
-        timeout = config_manager.settings.query_timeout_seconds
+        self._schedule_reload()
+        timeout = self._timeout
 
-        # Create tasks for parallel execution
-        tasks = [
-            self._query_single_model(model_id, prompt, temperature, timeout)
-            for model_id in model_ids
-        ]
+        # Hash the prompt once for every model (response cache and provider prompt caching)
+        cache_key = blake2b(prompt.encode(), digest_size=16).hexdigest()
 
-        # Execute all queries in parallel
-        responses = await asyncio.gather(*tasks, return_exceptions=False)
+        # Nothing to fan out for zero or one model
+        if not model_ids:
+            return ComparisonResponse.model_construct(
+                prompt=prompt,
+                timestamp=self._timestamp(),
+                responses=[]
+            )
+
+        if len(model_ids) == 1:
+            model_id = model_ids[0]
+            try:
+                async with asyncio.timeout(timeout):
+                    response = await self._query_single_model(model_id, prompt, temperature, cache_key)
+            except TimeoutError:
+                response = self._timeout_response(model_id, timeout)
+            return ComparisonResponse.model_construct(
+                prompt=prompt,
+                timestamp=self._timestamp(),
+                responses=[response]
+            )
 
-        # Create comparison response
-        return ComparisonResponse(
+        # Each task writes its response into its own slot when it completes
+        slots: List[Optional[ModelResponse]] = [None] * len(model_ids)
+        remaining = len(model_ids)
+        all_done = asyncio.Event()
+
+        def store(index: int, task: asyncio.Task):
+            nonlocal remaining
+            try:
+                if not task.cancelled():
+                    slots[index] = task.result()
+            except Exception as e:
+                slots[index] = self._error_response(model_ids[index], e)
+            finally:
+                # Count every task, or the wait below only ends at the deadline
+                remaining -= 1
+                if not remaining:
+                    all_done.set()
+
+        tasks = []
+        for index, model_id in enumerate(model_ids):
+            task = asyncio.create_task(
+                self._query_single_model(model_id, prompt, temperature, cache_key),
+                name=f"query:{model_id}"
+            )
+            task.add_done_callback(partial(store, index))
+            tasks.append(task)
+
+        # Execute all queries in parallel under a single deadline
+        try:
+            async with asyncio.timeout(timeout):
+                await all_done.wait()
+        except TimeoutError:
+            pass
+        finally:
+            # Stop models that are still running (no-op for finished tasks)
+            for task in tasks:
+                task.cancel()
+
+        # Snapshot the slots so late callbacks cannot mutate the returned list
+        responses = [
+            response if response is not None else self._timeout_response(model_id, timeout)
+            for model_id, response in zip(model_ids, slots)
+        ]
+
+        # Create comparison response (responses are already valid, skip revalidation)
+        return ComparisonResponse.model_construct(
             prompt=prompt,
-            timestamp=datetime.utcnow().isoformat() + "Z",
+            timestamp=self._timestamp(),
             responses=responses
         )
 
-    def clear_cache(self):
-        """Clear the adapter cache"""
-        self.adapters_cache = {}
-
 
 # Global orchestrator instance
 orchestrator = LLMOrchestrator()
@@ -2,17 +2,53 @@
 OpenAI-compatible adapter for OpenAI API, LM Studio, and Ollama
 """
 import time
+from functools import lru_cache
 from typing import Optional
+import httpx
+import openai
 from openai import AsyncOpenAI
-from biases_llm.services.llm_adapter import LLMAdapter
+from biases_llm.services.llm_adapter import (
+    LLMAdapter,
+    create_http_client,
+    friendly_error_message,
+    AUTH_ERROR,
+    CONNECTION_ERROR,
+    TIMEOUT_ERROR,
+    RATE_LIMIT_ERROR
+)
 from biases_llm.models.schemas import ModelResponse
 from biases_llm.config import config_manager
 
 
+@lru_cache(maxsize=32)
+def _openai_client(
+    base_url: Optional[str],
+    api_key: Optional[str],
+    http_client: httpx.AsyncClient
+) -> AsyncOpenAI:
+    """Get a client shared by all adapters using the same endpoint, API key and HTTP client"""
+    return AsyncOpenAI(
+        api_key=api_key,
+        base_url=base_url,
+        http_client=http_client
+    )
+
+
+# Provider exceptions mapped to friendly messages (timeout before its connection base class)
+_ERROR_TYPES = (
+    (openai.AuthenticationError, AUTH_ERROR),
+    (openai.RateLimitError, RATE_LIMIT_ERROR),
+    (openai.APITimeoutError, TIMEOUT_ERROR),
+    (openai.APIConnectionError, CONNECTION_ERROR),
+)
+
+
 class OpenAIAdapter(LLMAdapter):
     """Adapter for OpenAI and OpenAI-compatible APIs (LM Studio, Ollama)"""
 
-    def __init__(self, model_config: dict):
+    __slots__ = ("client", "_owns_client", "model_name_param", "use_prompt_cache_key")
+
+    def __init__(self, model_config: dict, http_client: Optional[httpx.AsyncClient] = None):
         super().__init__(model_config)
 
         # Get API key if required
@@ -28,11 +64,15 @@ class OpenAIAdapter(LLMAdapter):
         if model_config.get("endpoint_env"):
             base_url = config_manager.get_endpoint(model_config["endpoint_env"])
 
-        # Initialize OpenAI client
-        if base_url:
-            self.client = AsyncOpenAI(api_key=api_key, base_url=base_url)
+        # Reuse the pooled client for this endpoint, or own one when used standalone
+        self._owns_client = http_client is None
+        if self._owns_client:
+            self.client = AsyncOpenAI(api_key=api_key, base_url=base_url, http_client=create_http_client())
         else:
-            self.client = AsyncOpenAI(api_key=api_key)
+            self.client = _openai_client(base_url, api_key, http_client)
+
+        # prompt_cache_key is an OpenAI API extension, compatible servers may reject it
+        self.use_prompt_cache_key = base_url is None
 
         # Get the specific model name (for providers that need it)
         self.model_name_param = model_config.get("model_name") or model_config.get("id")
@@ -47,18 +87,34 @@ class OpenAIAdapter(LLMAdapter):
             return api_key is not None and len(api_key) > 0
         return True
 
-    async def query(self, prompt: str, temperature: float = 0.7) -> ModelResponse:
+    async def aclose(self):
+        """Close the SDK client if the adapter created its own HTTP client"""
+        if self._owns_client:
+            await self.client.close()
+
+    @classmethod
+    def clear_client_cache(cls):
+        """Forget SDK clients shared through an HTTP client that is being closed"""
+        _openai_client.cache_clear()
+
+    async def query(
+        self,
+        prompt: str,
+        temperature: float = 0.7,
+        cache_key: Optional[str] = None
+    ) -> ModelResponse:
         """
         Query the OpenAI-compatible API
 
         Args:
             prompt: The prompt to send to the LLM
             temperature: Temperature parameter for generation
+            cache_key: Stable hash of the prompt, sent as OpenAI's prompt_cache_key
 
         Returns:
             ModelResponse with result or error
         """
-        start_time = time.time()
+        start_time = time.perf_counter_ns()
 
         try:
             # Make API call
@@ -68,11 +124,15 @@ class OpenAIAdapter(LLMAdapter):
                     {"role": "user", "content": prompt}
                 ],
                 temperature=temperature,
-                max_tokens=500  # Reasonable limit for bias testing
+                max_tokens=500,  # Reasonable limit for bias testing
+                extra_body=(
+                    {"prompt_cache_key": cache_key}
+                    if cache_key and self.use_prompt_cache_key else None
+                )
             )
 
             # Calculate latency
-            latency_ms = int((time.time() - start_time) * 1000)
+            latency_ms = (time.perf_counter_ns() - start_time) // 1_000_000
 
             # Extract response text
             response_text = response.choices[0].message.content
@@ -87,20 +147,10 @@ class OpenAIAdapter(LLMAdapter):
 
         except Exception as e:
             # Calculate latency even for errors
-            latency_ms = int((time.time() - start_time) * 1000)
-
-            # Determine error message
-            error_msg = str(e)
+            latency_ms = (time.perf_counter_ns() - start_time) // 1_000_000
 
             # Provide user-friendly error messages
-            if "authentication" in error_msg.lower() or "api key" in error_msg.lower():
-                error_msg = "Authentication failed: Invalid or missing API key"
-            elif "connection" in error_msg.lower() or "refused" in error_msg.lower():
-                error_msg = f"Connection refused: Model not running or endpoint unreachable"
-            elif "timeout" in error_msg.lower():
-                error_msg = "Request timeout: Model took too long to respond"
-            elif "rate limit" in error_msg.lower():
-                error_msg = "Rate limit exceeded: Please wait before making more requests"
+            error_msg = friendly_error_message(e, _ERROR_TYPES)
 
             return ModelResponse(
                 model_id=self.model_id,
@@ -1,19 +1,84 @@
 """
 OpenAI-compatible adapter for OpenAI API, LM Studio, and Ollama
 """
+import asyncio
+import copy
 import time
+from functools import lru_cache
+from typing import Dict, List, Optional, Set, Tuple
 
-from transformers import AutoModelForSeq2SeqLM, AutoTokenizer
+import torch
+from transformers import AutoModelForSeq2SeqLM, AutoTokenizer, BitsAndBytesConfig
 
-from biases_llm.services.llm_adapter import LLMAdapter
+from biases_llm.services.llm_adapter import LLMAdapter, friendly_error_message
 from biases_llm.models.schemas import ModelResponse
 from biases_llm.config import config_manager
 
 
+# Supported floating point weight precisions ("int8" is quantized instead)
+_TORCH_DTYPES = {
+    "bfloat16": torch.bfloat16,
+    "float16": torch.float16,
+    "float32": torch.float32,
+}
+
+
+def _select_device() -> str:
+    """Pick the fastest available torch device"""
+    if torch.cuda.is_available():
+        return "cuda"
+    if torch.backends.mps.is_available():
+        return "mps"
+    return "cpu"
+
+
+@lru_cache(maxsize=4)
+def _load_model(model_name: str, dtype: Optional[str] = None):
+    """
+    Load a model and its tokenizer once and share them across adapters
+
+    Args:
+        model_name: HuggingFace model name or local path
+        dtype: Weight precision ("bfloat16", "float16", "float32" or "int8"),
+            None keeps the checkpoint default
+
+    Returns:
+        Tuple of (model, tokenizer)
+    """
+    kwargs = {}
+    if dtype == "int8":
+        # 8-bit weight quantization (requires bitsandbytes)
+        kwargs["quantization_config"] = BitsAndBytesConfig(load_in_8bit=True)
+    elif dtype:
+        try:
+            kwargs["dtype"] = _TORCH_DTYPES[dtype]
+        except KeyError:
+            raise ValueError(f"Unsupported dtype: {dtype}") from None
+
+    model = AutoModelForSeq2SeqLM.from_pretrained(model_name, **kwargs)
+    if dtype != "int8":
+        # Quantized models are placed on the GPU by bitsandbytes itself
+        model.to(_select_device())
+    model.eval()
+    tokenizer = AutoTokenizer.from_pretrained(model_name, use_fast=True)
+    return model, tokenizer
+
+
 class TransformersAdapter(LLMAdapter):
     """Adapter for transformers"""
 
-    def __init__(self, model_config: dict):
+    __slots__ = (
+        "model_name_param",
+        "model",
+        "tokenizer",
+        "generation_config",
+        "_pending",
+        "_generate_lock",
+        "_flush_tasks"
+    )
+
+    def __init__(self, model_config: dict, http_client=None):
+        # http_client is accepted for a uniform adapter constructor, local models make no HTTP calls
         super().__init__(model_config)
 
         # Get API key if required
@@ -32,6 +97,19 @@ class TransformersAdapter(LLMAdapter):
         # Get the specific model name (for providers that need it)
         self.model_name_param = model_config.get("model_name") or model_config.get("id")
 
+        # Load weights and tokenizer once instead of on every query
+        self.model, self.tokenizer = _load_model(self.model_name_param, model_config.get("dtype"))
+
+        # Generation settings built once, on top of the model's own defaults
+        self.generation_config = copy.deepcopy(self.model.generation_config)
+        self.generation_config.max_new_tokens = 500  # Reasonable limit for bias testing
+        self.generation_config.use_cache = True
+
+        # Prompts waiting to be generated together, grouped by temperature
+        self._pending: Dict[float, List[Tuple[str, asyncio.Future]]] = {}
+        self._generate_lock = asyncio.Lock()
+        self._flush_tasks: Set[asyncio.Task] = set()
+
     def validate_config(self) -> bool:
         """Validate that the adapter configuration is correct"""
         if self.model_config.get("requires_api_key"):
@@ -42,60 +120,133 @@ class TransformersAdapter(LLMAdapter):
             return api_key is not None and len(api_key) > 0
         return True
 
-    async def query(self, prompt: str, temperature: float = 0.7) -> ModelResponse:
+    def _generate(self, prompts: List[str], temperature: float) -> List[str]:
+        """Run blocking tokenization, generation and decoding for a batch of prompts"""
+        inputs = self.tokenizer(prompts, return_tensors="pt", padding=True).to(self.model.device)
+
+        # Sample only for non-zero temperatures, otherwise decode greedily
+        sampling = {"do_sample": True, "temperature": temperature} if temperature > 0 else {}
+
+        with torch.inference_mode():
+            outputs = self.model.generate(**inputs, generation_config=self.generation_config, **sampling)
+        return self.tokenizer.batch_decode(outputs, skip_special_tokens=True)
+
+    async def query_batch(self, prompts: List[str], temperature: float = 0.7) -> List[ModelResponse]:
         """
-        Query the OpenAI-compatible API
+        Query the model with several prompts in a single generate() call
 
         Args:
-            prompt: The prompt to send to the LLM
+            prompts: The prompts to send to the LLM
             temperature: Temperature parameter for generation
 
         Returns:
-            ModelResponse with result or error
+            List of ModelResponse, one per prompt, with result or error
         """
-        start_time = time.time()
+        start_time = time.perf_counter_ns()
 
         try:
-
-            model = AutoModelForSeq2SeqLM.from_pretrained(self.model_name_param)
-            tokenizer = AutoTokenizer.from_pretrained(self.model_name_param)
-
-            inputs = tokenizer(prompt, return_tensors="pt")
-            outputs = model.generate(**inputs)
-            response_text = tokenizer.batch_decode(outputs, skip_special_tokens=True)[0]
+            # Generate in a worker thread so the event loop keeps serving other models
+            response_texts = await asyncio.to_thread(self._generate, prompts, temperature)
 
             # Calculate latency
-            latency_ms = int((time.time() - start_time) * 1000)
-
-            return ModelResponse(
-                model_id=self.model_id,
-                model_name=self.model_name,
-                response=response_text,
-                latency_ms=latency_ms,
-                error=None
-            )
+            latency_ms = (time.perf_counter_ns() - start_time) // 1_000_000
+
+            return [
+                ModelResponse(
+                    model_id=self.model_id,
+                    model_name=self.model_name,
+                    response=response_text,
+                    latency_ms=latency_ms,
+                    error=None
+                )
+                for response_text in response_texts
+            ]
 
         except Exception as e:
             # Calculate latency even for errors
-            latency_ms = int((time.time() - start_time) * 1000)
-
-            # Determine error message
-            error_msg = str(e)
+            latency_ms = (time.perf_counter_ns() - start_time) // 1_000_000
 
             # Provide user-friendly error messages
-            if "authentication" in error_msg.lower() or "api key" in error_msg.lower():
-                error_msg = "Authentication failed: Invalid or missing API key"
-            elif "connection" in error_msg.lower() or "refused" in error_msg.lower():
-                error_msg = f"Connection refused: Model not running or endpoint unreachable"
-            elif "timeout" in error_msg.lower():
-                error_msg = "Request timeout: Model took too long to respond"
-            elif "rate limit" in error_msg.lower():
-                error_msg = "Rate limit exceeded: Please wait before making more requests"
-
-            return ModelResponse(
-                model_id=self.model_id,
-                model_name=self.model_name,
-                response=None,
-                latency_ms=latency_ms,
-                error=error_msg
-            )
+            error_msg = friendly_error_message(e)
+
+            return [
+                ModelResponse(
+                    model_id=self.model_id,
+                    model_name=self.model_name,
+                    response=None,
+                    latency_ms=latency_ms,
+                    error=error_msg
+                )
+                for _ in prompts
+            ]
+
+    async def _flush(self, temperature: float):
+        """Generate every prompt queued for a temperature as one batch"""
+        batch = None
+        try:
+            # Only one generate() runs at a time, prompts arriving meanwhile keep queuing
+            async with self._generate_lock:
+                # Skip prompts whose caller already gave up (cancelled or timed out)
+                batch = [
+                    (prompt, future)
+                    for prompt, future in self._pending.pop(temperature, [])
+                    if not future.done()
+                ]
+                if not batch:
+                    return
+                responses = await self.query_batch([prompt for prompt, _ in batch], temperature)
+
+            for (_, future), response in zip(batch, responses):
+                if not future.done():
+                    future.set_result(response)
+        finally:
+            # Cancelled before or during generation: settle every caller of this batch
+            if batch is None:
+                batch = self._pending.pop(temperature, [])
+            for _, future in batch:
+                if not future.done():
+                    future.cancel()
+
+    async def aclose(self):
+        """Cancel batches that are still waiting to be generated and their callers"""
+        for task in list(self._flush_tasks):
+            task.cancel()
+        for batch in self._pending.values():
+            for _, future in batch:
+                future.cancel()
+        self._pending.clear()
+
+    async def query(
+        self,
+        prompt: str,
+        temperature: float = 0.7,
+        cache_key: Optional[str] = None
+    ) -> ModelResponse:
+        """
+        Query the local model, batching concurrent prompts with the same temperature
+
+        Args:
+            prompt: The prompt to send to the LLM
+            temperature: Temperature parameter for generation
+            cache_key: Unused, local generation has no prompt cache
+
+        Returns:
+            ModelResponse with result or error
+        """
+        start_time = time.perf_counter_ns()
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+
+        pending = self._pending.setdefault(temperature, [])
+        pending.append((prompt, future))
+        if len(pending) == 1:
+            # First queued prompt schedules the batch the following ones join
+            task = loop.create_task(self._flush(temperature))
+            self._flush_tasks.add(task)
+            task.add_done_callback(self._flush_tasks.discard)
+
+        response = await future
+
+        # Report the latency seen by this caller, including time spent queued
+        response.latency_ms = (time.perf_counter_ns() - start_time) // 1_000_000
+        return response
@@ -0,0 +1,35 @@
+"""
+Static file serving with HTTP caching headers for the frontend
+"""
+import re
+from fastapi.staticfiles import StaticFiles
+
+# Fingerprinted assets such as app.3f2a9c1d.js never change under the same name
+_HASHED_ASSET = re.compile(r"\.[0-9a-f]{8,}\.(?:js|css)$")
+
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+# Unhashed scripts and styles are reused for a few minutes without a round trip
+SHORT_CACHE_CONTROL = "public, max-age=300"
+# HTML pages are revalidated so a new deployment is picked up on the next load
+REVALIDATE_CACHE_CONTROL = "no-cache"
+
+
+class CachedStaticFiles(StaticFiles):
+    """StaticFiles that lets browsers cache the frontend assets"""
+
+    def file_response(self, full_path, stat_result, scope, status_code=200):
+        """
+        Serve a file with a Cache-Control header
+
+        Hashed assets are cached for a year and other assets for five
+        minutes. HTML pages are revalidated against their ETag on every load.
+        """
+        response = super().file_response(full_path, stat_result, scope, status_code)
+        path = str(full_path)
+        if _HASHED_ASSET.search(path):
+            response.headers["cache-control"] = IMMUTABLE_CACHE_CONTROL
+        elif path.endswith(".html"):
+            response.headers["cache-control"] = REVALIDATE_CACHE_CONTROL
+        else:
+            response.headers["cache-control"] = SHORT_CACHE_CONTROL
+        return response